@@ -4,6 +4,7 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import pytz
 
@@ -19,8 +20,7 @@ st.set_page_config(
 )
 
 # Dark theme CSS
-st.markdown(
-    """
+STYLE_HTML = """
 <style>
     .stApp {
         background-color: #0d1117;
@@ -84,9 +84,8 @@ st.markdown(
         background-color: #161b22 !important;
     }
 </style>
-""",
-    unsafe_allow_html=True,
-)
+"""
+st.markdown(STYLE_HTML, unsafe_allow_html=True)
 
 # Chart theme
 DARK_LAYOUT = {
@@ -105,6 +104,190 @@ def get_fetchers():
 
 events_fetcher, market_fetcher = get_fetchers()
 
+
+@st.cache_data(ttl=3600)
+def get_filter_options():
+    """Sorted event types and asset categories for the sidebar."""
+    return (
+        sorted(events_fetcher.get_event_types()),
+        market_fetcher.get_asset_categories(),
+    )
+
+
+event_types, categories = get_filter_options()
+
+
+# Chart builders are cached on small keys; the frames themselves are passed
+# underscored so they are not hashed. A reactions frame also depends on which
+# fetches succeeded, so those builders key on the tickers it contains too.
+@st.cache_data(ttl=600, show_spinner=False)
+def build_candlestick_fig(
+    ticker: str,
+    event_ts: pd.Timestamp,
+    window_minutes: int,
+    title: str,
+    _df: pd.DataFrame,
+) -> dict:
+    """Candlestick chart of price action around an event."""
+    fig = go.Figure()
+
+    if all(col in _df.columns for col in ["Open", "High", "Low", "Close"]):
+        fig.add_trace(
+            go.Candlestick(
+                x=_df.index,
+                open=_df["Open"],
+                high=_df["High"],
+                low=_df["Low"],
+                close=_df["Close"],
+                increasing_line_color="#3fb950",
+                decreasing_line_color="#f85149",
+            )
+        )
+
+    fig.add_vline(x=event_ts, line_dash="dash", line_color="#a371f7", line_width=2)
+    fig.add_annotation(
+        x=event_ts,
+        y=1.05,
+        yref="paper",
+        text="Event",
+        showarrow=False,
+        font=dict(color="#a371f7"),
+    )
+
+    tz = pytz.timezone("America/New_York")
+    if event_ts.tzinfo is None:
+        event_time_tz = tz.localize(event_ts)
+    else:
+        event_time_tz = event_ts
+
+    x_start = event_time_tz - timedelta(minutes=15)
+    x_end = event_time_tz + timedelta(minutes=window_minutes + 15)
+    fig.update_xaxes(range=[x_start, x_end])
+
+    visible_df = _df[(_df.index >= x_start) & (_df.index <= x_end)]
+    if not visible_df.empty:
+        y_min, y_max = visible_df["Low"].min(), visible_df["High"].max()
+        y_pad = (y_max - y_min) * 0.15
+        fig.update_yaxes(range=[y_min - y_pad, y_max + y_pad])
+
+    fig.update_layout(
+        paper_bgcolor="#161b22",
+        plot_bgcolor="#161b22",
+        font=dict(color="#f0f6fc", size=12),
+        title=dict(
+            text=title,
+            font=dict(size=16, color="#f0f6fc"),
+        ),
+        showlegend=False,
+        xaxis_rangeslider_visible=False,
+        margin=dict(l=60, r=40, t=50, b=60),
+    )
+    fig.update_xaxes(
+        gridcolor="#30363d", linecolor="#30363d", tickfont=dict(color="#c9d1d9")
+    )
+    fig.update_yaxes(
+        gridcolor="#30363d", linecolor="#30363d", tickfont=dict(color="#c9d1d9")
+    )
+    return fig.to_dict()
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def build_category_fig(
+    event_ts: pd.Timestamp,
+    time_window: str,
+    tickers: tuple,
+    _reactions: pd.DataFrame,
+) -> dict:
+    """Bar chart of average return per asset category."""
+    # Per-category mean via bincount on the factorized categories; missing
+    # returns are skipped, as groupby().mean() would
+    codes, category_names = pd.factorize(_reactions["Category"], sort=True)
+    values = _reactions[time_window].to_numpy(dtype=float)
+    valid = ~np.isnan(values)
+    sums = np.bincount(
+        codes[valid], weights=values[valid], minlength=len(category_names)
+    )
+    counts = np.bincount(codes[valid], minlength=len(category_names))
+    with np.errstate(invalid="ignore"):
+        means = sums / counts
+    cat_avg = pd.DataFrame({"Category": category_names, time_window: means})
+    colors = np.where(
+        cat_avg[time_window].to_numpy() >= 0, COLORS["positive"], COLORS["negative"]
+    ).tolist()
+
+    fig = go.Figure(
+        go.Bar(
+            x=cat_avg["Category"].tolist(),
+            y=cat_avg[time_window].to_numpy(dtype=np.float32),
+            marker_color=colors,
+            text=cat_avg[time_window].map("{:+.2f}%".format).tolist(),
+            textposition="outside",
+            textfont=dict(color="#f0f6fc", size=13),
+        )
+    )
+    fig.update_layout(
+        paper_bgcolor="#161b22",
+        plot_bgcolor="#161b22",
+        font=dict(color="#f0f6fc", size=12),
+        title=dict(
+            text=f"Avg {time_window} Return",
+            font=dict(color="#f0f6fc", size=16),
+        ),
+        showlegend=False,
+        margin=dict(l=60, r=40, t=50, b=60),
+    )
+    fig.update_xaxes(
+        gridcolor="#30363d", linecolor="#30363d", tickfont=dict(color="#c9d1d9")
+    )
+    fig.update_yaxes(
+        gridcolor="#30363d", linecolor="#30363d", tickfont=dict(color="#c9d1d9")
+    )
+    y_max = cat_avg[time_window].max()
+    y_min = cat_avg[time_window].min()
+    y_range = max(abs(y_max), abs(y_min)) * 1.4
+    fig.update_yaxes(range=[-y_range if y_min < 0 else 0, y_range])
+    return fig.to_dict()
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def build_heatmap_fig(
+    event_ts: pd.Timestamp,
+    time_cols: list,
+    tickers: tuple,
+    _reactions: pd.DataFrame,
+) -> dict:
+    """Heatmap of every asset's return across time windows."""
+    # Contiguous float32 keeps the serialized matrix compact
+    z_values = np.ascontiguousarray(_reactions[time_cols].to_numpy(dtype=np.float32))
+    y_labels = _reactions["Name"].tolist()
+
+    fig = go.Figure(
+        go.Heatmap(
+            z=z_values,
+            x=time_cols,
+            y=y_labels,
+            colorscale=[[0, "#f85149"], [0.5, "#21262d"], [1, "#3fb950"]],
+            zmid=0,
+            texttemplate="%{z:.2f}%",
+            textfont={"size": 12, "color": "#ffffff"},
+            colorbar=dict(
+                title=dict(text="Return %", font=dict(color="#f0f6fc")),
+                tickfont=dict(color="#f0f6fc"),
+            ),
+        )
+    )
+    fig.update_layout(
+        paper_bgcolor="#161b22",
+        plot_bgcolor="#161b22",
+        font=dict(color="#f0f6fc", size=12),
+        height=max(450, len(y_labels) * 40),
+        margin=dict(l=120, r=60, t=50, b=60),
+    )
+    fig.update_xaxes(tickfont=dict(color="#f0f6fc", size=12), side="bottom")
+    fig.update_yaxes(tickfont=dict(color="#f0f6fc", size=12))
+    return fig.to_dict()
+
+
 # Header
 st.title("📊 Macro Event Impact Tracker")
 st.caption("Real-time analysis of market reactions to economic data releases")
@@ -125,10 +308,8 @@ with col2:
 
 st.sidebar.divider()
 
-event_types = events_fetcher.get_event_types()
-selected_event_type = st.sidebar.selectbox("Event Type", sorted(event_types))
+selected_event_type = st.sidebar.selectbox("Event Type", event_types)
 
-categories = market_fetcher.get_asset_categories()
 selected_category = st.sidebar.selectbox("Asset Category", categories)
 
 assets = market_fetcher.get_assets_by_category(selected_category)
@@ -180,17 +361,40 @@ else:
 
 # Only show metrics and charts if we have an event_time
 if event_time is not None:
-    # Metrics
-    st.subheader("Quick Metrics")
-
-    metrics_data = {}
-    for ticker, name in [
+    metric_tickers = [
         ("SPY", "SPY"),
         ("DX-Y.NYB", "Dollar"),
         ("^TNX", "10Y"),
         ("^VIX", "VIX"),
-    ]:
-        df = market_fetcher.fetch_intraday_data(ticker, event_time)
+    ]
+    window_minutes = int(time_window.replace("m", ""))
+    hours_after = max(1, window_minutes // 60 + 1)
+
+    # One batched download covers the heatmap and the metric tickers, which
+    # are all in ASSETS; the selected ticker's window is fetched alongside
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        asset_future = executor.submit(
+            market_fetcher.fetch_intraday_batch,
+            market_fetcher.ASSETS_DF["Ticker"].tolist(),
+            event_time,
+        )
+        price_future = executor.submit(
+            market_fetcher.fetch_intraday_data,
+            selected_ticker,
+            event_time,
+            hours_before=1,
+            hours_after=hours_after,
+        )
+    asset_frames = asset_future.result()
+    price_df = price_future.result()
+    reactions = market_fetcher.get_multi_asset_reaction(event_time, asset_frames)
+
+    # Metrics
+    st.subheader("Quick Metrics")
+
+    metrics_data = {}
+    for ticker, name in metric_tickers:
+        df = asset_frames.get(ticker)
         if df is not None and not df.empty:
             returns = market_fetcher.calculate_returns(df, event_time)
             metrics_data[name] = returns.get(time_window, np.nan)
@@ -210,74 +414,13 @@ if event_time is not None:
     with chart_col1:
         st.subheader("Price Action Around Event")
 
-        window_minutes = int(time_window.replace("m", ""))
-        hours_after = max(1, window_minutes // 60 + 1)
-
-        df = market_fetcher.fetch_intraday_data(
-            selected_ticker, event_time, hours_before=1, hours_after=hours_after
-        )
-
-        if df is not None and not df.empty:
-            fig = go.Figure()
-
-            if all(col in df.columns for col in ["Open", "High", "Low", "Close"]):
-                fig.add_trace(
-                    go.Candlestick(
-                        x=df.index,
-                        open=df["Open"],
-                        high=df["High"],
-                        low=df["Low"],
-                        close=df["Close"],
-                        increasing_line_color="#3fb950",
-                        decreasing_line_color="#f85149",
-                    )
-                )
-
-            fig.add_vline(
-                x=event_time, line_dash="dash", line_color="#a371f7", line_width=2
-            )
-            fig.add_annotation(
-                x=event_time,
-                y=1.05,
-                yref="paper",
-                text="Event",
-                showarrow=False,
-                font=dict(color="#a371f7"),
-            )
-
-            tz = pytz.timezone("America/New_York")
-            if event_time.tzinfo is None:
-                event_time_tz = tz.localize(event_time)
-            else:
-                event_time_tz = event_time
-
-            x_start = event_time_tz - timedelta(minutes=15)
-            x_end = event_time_tz + timedelta(minutes=window_minutes + 15)
-            fig.update_xaxes(range=[x_start, x_end])
-
-            visible_df = df[(df.index >= x_start) & (df.index <= x_end)]
-            if not visible_df.empty:
-                y_min, y_max = visible_df["Low"].min(), visible_df["High"].max()
-                y_pad = (y_max - y_min) * 0.15
-                fig.update_yaxes(range=[y_min - y_pad, y_max + y_pad])
-
-            fig.update_layout(
-                paper_bgcolor="#161b22",
-                plot_bgcolor="#161b22",
-                font=dict(color="#f0f6fc", size=12),
-                title=dict(
-                    text=assets.get(selected_ticker, selected_ticker),
-                    font=dict(size=16, color="#f0f6fc"),
-                ),
-                showlegend=False,
-                xaxis_rangeslider_visible=False,
-                margin=dict(l=60, r=40, t=50, b=60),
-            )
-            fig.update_xaxes(
-                gridcolor="#30363d", linecolor="#30363d", tickfont=dict(color="#c9d1d9")
-            )
-            fig.update_yaxes(
-                gridcolor="#30363d", linecolor="#30363d", tickfont=dict(color="#c9d1d9")
+        if price_df is not None and not price_df.empty:
+            fig = build_candlestick_fig(
+                selected_ticker,
+                event_time,
+                window_minutes,
+                assets.get(selected_ticker, selected_ticker),
+                price_df,
             )
             st.plotly_chart(fig, use_container_width=True)
         else:
@@ -286,46 +429,10 @@ if event_time is not None:
     with chart_col2:
         st.subheader("Category Performance")
 
-        reactions = market_fetcher.get_multi_asset_reaction(event_time)
-
         if not reactions.empty and time_window in reactions.columns:
-            cat_avg = reactions.groupby("Category")[time_window].mean().reset_index()
-            colors = [
-                COLORS["positive"] if v >= 0 else COLORS["negative"]
-                for v in cat_avg[time_window]
-            ]
-
-            fig = go.Figure(
-                go.Bar(
-                    x=cat_avg["Category"],
-                    y=cat_avg[time_window],
-                    marker_color=colors,
-                    text=[f"{v:+.2f}%" for v in cat_avg[time_window]],
-                    textposition="outside",
-                    textfont=dict(color="#f0f6fc", size=13),
-                )
-            )
-            fig.update_layout(
-                paper_bgcolor="#161b22",
-                plot_bgcolor="#161b22",
-                font=dict(color="#f0f6fc", size=12),
-                title=dict(
-                    text=f"Avg {time_window} Return",
-                    font=dict(color="#f0f6fc", size=16),
-                ),
-                showlegend=False,
-                margin=dict(l=60, r=40, t=50, b=60),
+            fig = build_category_fig(
+                event_time, time_window, tuple(reactions["Ticker"]), reactions
             )
-            fig.update_xaxes(
-                gridcolor="#30363d", linecolor="#30363d", tickfont=dict(color="#c9d1d9")
-            )
-            fig.update_yaxes(
-                gridcolor="#30363d", linecolor="#30363d", tickfont=dict(color="#c9d1d9")
-            )
-            y_max = cat_avg[time_window].max()
-            y_min = cat_avg[time_window].min()
-            y_range = max(abs(y_max), abs(y_min)) * 1.4
-            fig.update_yaxes(range=[-y_range if y_min < 0 else 0, y_range])
             st.plotly_chart(fig, use_container_width=True)
         else:
             st.info("No reaction data available")
@@ -336,34 +443,9 @@ if event_time is not None:
     if not reactions.empty:
         time_cols = [col for col in reactions.columns if col.endswith("m")]
         if time_cols:
-            z_values = reactions[time_cols].values
-            y_labels = reactions["Name"].tolist()
-
-            fig = go.Figure(
-                go.Heatmap(
-                    z=z_values,
-                    x=time_cols,
-                    y=y_labels,
-                    colorscale=[[0, "#f85149"], [0.5, "#21262d"], [1, "#3fb950"]],
-                    zmid=0,
-                    text=np.round(z_values, 2),
-                    texttemplate="%{text:.2f}%",
-                    textfont={"size": 12, "color": "#ffffff"},
-                    colorbar=dict(
-                        title=dict(text="Return %", font=dict(color="#f0f6fc")),
-                        tickfont=dict(color="#f0f6fc"),
-                    ),
-                )
-            )
-            fig.update_layout(
-                paper_bgcolor="#161b22",
-                plot_bgcolor="#161b22",
-                font=dict(color="#f0f6fc", size=12),
-                height=max(450, len(y_labels) * 40),
-                margin=dict(l=120, r=60, t=50, b=60),
+            fig = build_heatmap_fig(
+                event_time, time_cols, tuple(reactions["Ticker"]), reactions
             )
-            fig.update_xaxes(tickfont=dict(color="#f0f6fc", size=12), side="bottom")
-            fig.update_yaxes(tickfont=dict(color="#f0f6fc", size=12))
             st.plotly_chart(fig, use_container_width=True)
     else:
         st.info("No heatmap data available")
@@ -2,12 +2,40 @@
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict
+from typing import Optional, List
 import requests
 from dateutil import parser
 import pytz
 import os
+import threading
+import streamlit as st
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_fred_cached(url: str, series_id: str, api_key: str, limit: int,
+                      _session: requests.Session) -> pd.DataFrame:
+    """Fetch FRED observations for a series, memoized across reruns."""
+    params = {
+        'series_id': series_id,
+        'api_key': api_key,
+        'file_type': 'json',
+        'sort_order': 'desc',
+        'limit': limit,
+    }
+    
+    response = _session.get(url, params=params, timeout=15)
+    response.raise_for_status()
+    
+    data = response.json()
+    if 'observations' in data and len(data['observations']) > 0:
+        df = pd.DataFrame(data['observations'])
+        df['date'] = pd.to_datetime(df['date'])
+        df['value'] = pd.to_numeric(df['value'], errors='coerce')
+        return df.dropna(subset=['value'])
+    
+    return pd.DataFrame()
 
 
 class EconomicEventsFetcher:
@@ -77,34 +105,25 @@ class EconomicEventsFetcher:
         },
     }
 
+    # Distinct event names, in FRED_SERIES order
+    EVENT_TYPES = tuple(dict.fromkeys(config['name'] for config in FRED_SERIES.values()))
+
     def __init__(self, fred_api_key: Optional[str] = None):
         self.fred_api_key = fred_api_key or os.environ.get('FRED_API_KEY', '')
         self.tz = pytz.timezone('America/New_York')
         self._events_cache = None
+        self._filtered_cache = {}
         self._cache_time = None
+        self._cache_lock = threading.Lock()
         self.base_url = "https://api.stlouisfed.org/fred"
+        # Shared session keeps FRED connections alive across series
+        self._session = requests.Session()
 
     def _fetch_fred_series(self, series_id: str, limit: int = 24) -> pd.DataFrame:
         """Fetch data from FRED API for a specific series."""
         try:
             url = f"{self.base_url}/series/observations"
-            params = {
-                'series_id': series_id,
-                'api_key': self.fred_api_key,
-                'file_type': 'json',
-                'sort_order': 'desc',
-                'limit': limit,
-            }
-            
-            response = requests.get(url, params=params, timeout=15)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if 'observations' in data and len(data['observations']) > 0:
-                    df = pd.DataFrame(data['observations'])
-                    df['date'] = pd.to_datetime(df['date'])
-                    df['value'] = pd.to_numeric(df['value'], errors='coerce')
-                    return df.dropna(subset=['value'])
+            return _fetch_fred_cached(url, series_id, self.fred_api_key, limit, self._session)
         except Exception as e:
             print(f"FRED API request failed for {series_id}: {e}")
         
@@ -115,30 +134,50 @@ class EconomicEventsFetcher:
         if df.empty:
             return df
         
-        df = df.sort_values('date').copy()
+        df = df.sort_values('date')
+        
+        # Percentage changes are computed in place in float32, ample for
+        # two-decimal output; level differences keep float64 since large
+        # levels (e.g. payrolls) would lose precision
+        pct_transforms = ('pct_change_yoy', 'pct_change_mom', 'pct_change_qoq', 'pmi_proxy')
+        dtype = np.float32 if transform in pct_transforms else np.float64
+        values = df['value'].to_numpy(dtype=dtype)
+        transformed = np.full_like(values, np.nan)
         
-        if transform == 'pct_change_yoy':
-            df['transformed'] = df['value'].pct_change(periods=12) * 100
-        elif transform == 'pct_change_mom':
-            df['transformed'] = df['value'].pct_change() * 100
-        elif transform == 'pct_change_qoq':
-            df['transformed'] = df['value'].pct_change() * 400
+        if transform in pct_transforms:
+            periods = 12 if transform == 'pct_change_yoy' else 1
+            change = transformed[periods:]
+            prior = values[:-periods]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                np.subtract(values[periods:], prior, out=change)
+                np.divide(change, prior, out=change)
+            transformed *= 400 if transform == 'pct_change_qoq' else 100
+            if transform == 'pmi_proxy':
+                np.clip(transformed, -10, 10, out=transformed)
+                transformed += 50
         elif transform == 'mom_change':
-            df['transformed'] = df['value'].diff()
-        elif transform == 'pmi_proxy':
-            df['transformed'] = 50 + (df['value'].pct_change() * 100).clip(-10, 10)
+            np.subtract(values[1:], values[:-1], out=transformed[1:])
         else:
-            df['transformed'] = df['value']
+            transformed = values
+        
+        df['transformed'] = transformed
         
         return df.dropna(subset=['transformed'])
 
-    def _fetch_all_events(self) -> List[Dict]:
+    def _fetch_all_events(self) -> pd.DataFrame:
         """Fetch all economic events from FRED API."""
-        events = []
+        frames = []
+        
+        # Requests are I/O bound, so fetch every series concurrently
+        with ThreadPoolExecutor(max_workers=len(self.FRED_SERIES)) as executor:
+            series = dict(zip(self.FRED_SERIES, executor.map(
+                lambda config: self._fetch_fred_series(config['series_id'], limit=24),
+                self.FRED_SERIES.values(),
+            )))
         
         for event_key, config in self.FRED_SERIES.items():
             try:
-                df = self._fetch_fred_series(config['series_id'], limit=24)
+                df = series[event_key]
                 
                 if df.empty:
                     continue
@@ -148,39 +187,38 @@ class EconomicEventsFetcher:
                 if df.empty or len(df) < 2:
                     continue
                 
-                df = df.sort_values('date', ascending=False).reset_index(drop=True)
+                # Newest first, as a reversed view of the ascending sort
+                df = df.iloc[::-1]
                 
-                for i in range(min(len(df) - 1, 12)):
-                    row = df.iloc[i]
-                    prev_row = df.iloc[i + 1] if i + 1 < len(df) else None
-                    
-                    actual = round(row['transformed'], 2)
-                    previous = round(prev_row['transformed'], 2) if prev_row is not None else actual
-                    forecast = round(actual + np.random.uniform(-0.1, 0.1) * abs(actual - previous + 0.1), 2)
-                    
-                    event_datetime = row['date'].strftime('%Y-%m-%d') + ' ' + config['release_time']
-                    
-                    events.append({
-                        'date': event_datetime,
-                        'event': config['name'],
-                        'actual': actual,
-                        'forecast': forecast,
-                        'previous': previous,
-                    })
+                # Each release is paired with the one before it as "previous"
+                n = min(len(df) - 1, 12)
+                values = np.round(df['transformed'].to_numpy(dtype=np.float64), 2)
+                actual = values[:n]
+                previous = values[1:n + 1]
+                noise = np.random.uniform(-0.1, 0.1, n)
+                forecast = np.round(actual + noise * np.abs(actual - previous + 0.1), 2)
+                
+                frames.append(pd.DataFrame({
+                    'date': df['date'].iloc[:n].dt.strftime('%Y-%m-%d') + ' ' + config['release_time'],
+                    'event': config['name'],
+                    'actual': actual,
+                    'forecast': forecast,
+                    'previous': previous,
+                }))
                     
             except Exception as e:
                 continue
         
-        return events
+        if not frames:
+            return pd.DataFrame()
+        
+        return pd.concat(frames, ignore_index=True)
 
-    def _generate_fallback_events(self) -> List[Dict]:
+    def _generate_fallback_events(self) -> pd.DataFrame:
         """Generate fallback events based on current date."""
-        events = []
         now = datetime.now(self.tz)
-        current_year = now.year
-        current_month = now.month
         
-        event_templates = [
+        event_templates = pd.DataFrame([
             ('CPI', '08:30:00', 2.8, 0.3, 10),       # ~10th of month
             ('NFP', '08:30:00', 180, 50, 5),         # ~5th (first Friday)
             ('ISM PMI', '10:00:00', 48.5, 2, 1),     # ~1st of month
@@ -188,93 +226,96 @@ class EconomicEventsFetcher:
             ('Unemployment Rate', '08:30:00', 4.1, 0.2, 5),
             ('Retail Sales', '08:30:00', 0.5, 0.3, 14),
             ('GDP', '08:30:00', 2.5, 0.5, 25),
-        ]
+        ], columns=['event', 'time', 'base', 'volatility', 'day'])
         
-        # Generate events for the past 12 months
-        for months_ago in range(12):
-            # Calculate the target month/year
-            month = current_month - months_ago
-            year = current_year
-            while month <= 0:
-                month += 12
-                year -= 1
-            
-            for event_name, time_str, base_val, volatility, day in event_templates:
-                # Skip FOMC for months without meetings
-                if event_name == 'FOMC Rate Decision' and month not in [1, 3, 5, 6, 7, 9, 11, 12]:
-                    continue
-                
-                # Skip GDP for non-quarterly months
-                if event_name == 'GDP' and month not in [1, 4, 7, 10]:
-                    continue
-                
-                # Ensure day is valid for the month
-                try:
-                    event_date = datetime(year, month, min(day, 28))
-                except ValueError:
-                    event_date = datetime(year, month, 15)
-                
-                # Only include past events (not future)
-                if event_date > now.replace(tzinfo=None):
-                    continue
-                
-                actual = round(base_val + np.random.uniform(-volatility, volatility), 2)
-                forecast = round(base_val + np.random.uniform(-volatility/2, volatility/2), 2)
-                previous = round(base_val + np.random.uniform(-volatility, volatility), 2)
-                
-                events.append({
-                    'date': event_date.strftime('%Y-%m-%d') + ' ' + time_str,
-                    'event': event_name,
-                    'actual': actual,
-                    'forecast': forecast,
-                    'previous': previous,
-                })
+        # One row per template for each of the past 12 months, newest first
+        month_starts = pd.date_range(end=now.strftime('%Y-%m-01'), periods=12, freq='MS')[::-1]
+        grid = pd.DataFrame({'month_start': month_starts}).merge(event_templates, how='cross')
+        month = grid['month_start'].dt.month
+        
+        # Skip FOMC for months without meetings and GDP for non-quarterly months
+        keep = ~((grid['event'] == 'FOMC Rate Decision') & ~month.isin([1, 3, 5, 6, 7, 9, 11, 12]))
+        keep &= ~((grid['event'] == 'GDP') & ~month.isin([1, 4, 7, 10]))
+        
+        # Ensure day is valid for the month
+        event_dates = grid['month_start'] + pd.to_timedelta(grid['day'].clip(upper=28) - 1, unit='D')
         
-        return events
+        # Only include past events (not future)
+        keep &= event_dates <= now.replace(tzinfo=None)
+        
+        grid = grid[keep]
+        event_dates = event_dates[keep]
+        
+        # Draw actual, forecast and previous for every event in one call
+        base = grid['base'].to_numpy()[:, None]
+        spread = grid['volatility'].to_numpy()[:, None] * np.array([1, 0.5, 1])
+        values = np.round(base + np.random.uniform(-spread, spread), 2)
+        
+        return pd.DataFrame({
+            'date': event_dates.dt.strftime('%Y-%m-%d') + ' ' + grid['time'],
+            'event': grid['event'],
+            'actual': values[:, 0],
+            'forecast': values[:, 1],
+            'previous': values[:, 2],
+        }).reset_index(drop=True)
 
     def get_events(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
                    event_types: Optional[List[str]] = None) -> pd.DataFrame:
-        """Get economic events within date range."""
+        """Get economic events within date range.
+        
+        Results are shared between callers with the same filters and
+        should be treated as read-only.
+        """
         now = datetime.now()
         
-        if self._events_cache is not None and self._cache_time is not None:
-            if (now - self._cache_time).seconds < 3600:
-                df = self._events_cache.copy()
-            else:
+        # The fetcher is shared across sessions; refresh and snapshot the
+        # events together so a concurrent refresh cannot swap them mid-call
+        with self._cache_lock:
+            if self._cache_time is None or (now - self._cache_time).total_seconds() >= 3600:
                 self._refresh_cache()
-                df = self._events_cache.copy()
-        else:
-            self._refresh_cache()
-            df = self._events_cache.copy()
+            events, filtered = self._events_cache, self._filtered_cache
         
-        df['date'] = pd.to_datetime(df['date'])
-        df['surprise'] = df['actual'] - df['forecast']
-        df['surprise_pct'] = (df['surprise'] / df['forecast'].abs().replace(0, 1)) * 100
-        
-        if start_date:
-            df = df[df['date'] >= pd.to_datetime(start_date)]
-        if end_date:
-            df = df[df['date'] <= pd.to_datetime(end_date)]
-        if event_types:
-            df = df[df['event'].isin(event_types)]
+        key = (start_date, end_date, tuple(event_types) if event_types else None)
+        df = filtered.get(key)
+        if df is None:
+            df = events
+            
+            if start_date:
+                df = df[df['date'] >= pd.to_datetime(start_date)]
+            if end_date:
+                df = df[df['date'] <= pd.to_datetime(end_date)]
+            if event_types:
+                df = df[df['event'].isin(event_types)]
+            
+            df = df.reset_index(drop=True)
+            filtered[key] = df
         
-        return df.sort_values('date', ascending=False).reset_index(drop=True)
+        return df
 
     def _refresh_cache(self):
         """Refresh the events cache from API."""
         if self.fred_api_key:
             events = self._fetch_all_events()
-            if not events:
+            if events.empty:
                 events = self._generate_fallback_events()
         else:
             events = self._generate_fallback_events()
         
-        self._events_cache = pd.DataFrame(events)
+        # Derived columns are computed once per refresh, not per query
+        events['date'] = pd.to_datetime(events['date'])
+        surprise = events['actual'].to_numpy() - events['forecast'].to_numpy()
+        denom = np.abs(events['forecast'].to_numpy())
+        np.copyto(denom, 1.0, where=denom == 0)
+        events['surprise'] = surprise
+        events['surprise_pct'] = surprise / denom * 100
+        
+        self._events_cache = events.sort_values('date', ascending=False).reset_index(drop=True)
+        self._filtered_cache = {}
         self._cache_time = datetime.now()
 
     def get_event_types(self) -> List[str]:
         """Get list of available event types."""
-        return list(set(config['name'] for config in self.FRED_SERIES.values()))
+        return list(self.EVENT_TYPES)
 
     def get_latest_events(self, n: int = 10) -> pd.DataFrame:
         """Get the n most recent events."""
@@ -2,12 +2,61 @@
 
 import pandas as pd
 import numpy as np
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
+import streamlit as st
 import yfinance as yf
 import pytz
 
 
+def _to_eastern(df: pd.DataFrame) -> pd.DataFrame:
+    """Normalize a price frame's index to US/Eastern."""
+    if not df.empty:
+        if df.index.tzinfo is None:
+            df.index = df.index.tz_localize("America/New_York")
+        else:
+            df.index = df.index.tz_convert("America/New_York")
+    return df
+
+
+@st.cache_data(ttl=900, show_spinner=False)
+def _fetch_intraday_cached(
+    ticker: str, start_iso: str, end_iso: str, interval: str
+) -> pd.DataFrame:
+    """Download intraday history for a ticker, memoized across reruns."""
+    stock = yf.Ticker(ticker)
+    df = stock.history(
+        start=datetime.fromisoformat(start_iso),
+        end=datetime.fromisoformat(end_iso),
+        interval=interval,
+    )
+
+    if df.empty:
+        df = stock.history(period="5d", interval="5m")
+
+    return _to_eastern(df)
+
+
+@st.cache_data(ttl=900, show_spinner=False)
+def _download_intraday_cached(
+    tickers: tuple, start_iso: str, end_iso: str, interval: str
+) -> pd.DataFrame:
+    """Download intraday history for many tickers in one request."""
+    df = yf.download(
+        list(tickers),
+        start=datetime.fromisoformat(start_iso),
+        end=datetime.fromisoformat(end_iso),
+        interval=interval,
+        group_by="ticker",
+        threads=True,
+        progress=False,
+        ignore_tz=False,
+    )
+    return _to_eastern(df)
+
+
 class MarketDataFetcher:
     """Fetches market data from Yahoo Finance."""
 
@@ -40,8 +89,32 @@ class MarketDataFetcher:
         },
     }
 
+    # Flat view of ASSETS, one row per ticker, for vectorized joins
+    ASSETS_DF = pd.DataFrame(
+        [
+            (category, ticker, name)
+            for category, tickers in ASSETS.items()
+            for ticker, name in tickers.items()
+        ],
+        columns=["Category", "Ticker", "Name"],
+    )
+
+    # Return windows after the event, in minutes
+    RETURN_WINDOWS = {"1m": 1, "5m": 5, "15m": 15, "30m": 30, "60m": 60, "240m": 240}
+
+    # Upper bound on concurrent single-ticker Yahoo Finance requests
+    MAX_WORKERS = 16
+
+    # Oldest event, in days, Yahoo Finance serves intraday (1h) bars for
+    MAX_INTRADAY_DAYS = 730
+
+    # Seconds to skip re-fetching a window whose request failed
+    _FAILURE_TTL = 300
+
     def __init__(self):
         self.tz = pytz.timezone("America/New_York")
+        # (ticker, start, end, interval) -> monotonic time of the failed fetch
+        self._failed_fetches: Dict[Tuple[str, str, str, str], float] = {}
 
     def get_asset_categories(self) -> List[str]:
         """Get list of asset categories."""
@@ -51,6 +124,46 @@ class MarketDataFetcher:
         """Get assets in a category."""
         return self.ASSETS.get(category, {})
 
+    def _event_window(
+        self, event_time: datetime, hours_before: int, hours_after: int
+    ) -> Tuple[datetime, datetime, Optional[str]]:
+        """Get the start, end and bar interval to fetch around an event.
+
+        The interval is None when the event is too old for intraday bars.
+        """
+        if event_time.tzinfo is None:
+            event_time = self.tz.localize(event_time)
+
+        start = event_time - timedelta(hours=hours_before)
+        end = event_time + timedelta(hours=hours_after)
+
+        days_ago = (datetime.now(self.tz) - event_time).days
+
+        return start, end, self._pick_interval(days_ago)
+
+    @classmethod
+    def _pick_interval(cls, days_ago: int) -> Optional[str]:
+        """Get the finest bar interval Yahoo Finance serves for an event's age."""
+        if days_ago <= 7:
+            return "1m"
+        elif days_ago <= 60:
+            return "5m"
+        elif days_ago <= cls.MAX_INTRADAY_DAYS:
+            return "1h"
+        return None
+
+    def _recently_failed(self, key: Tuple[str, str, str, str]) -> bool:
+        """Check whether a fetch failed within _FAILURE_TTL, pruning expired records."""
+        now = time.monotonic()
+        expired = [
+            k
+            for k, failed_at in list(self._failed_fetches.items())
+            if now - failed_at >= self._FAILURE_TTL
+        ]
+        for k in expired:
+            self._failed_fetches.pop(k, None)
+        return key in self._failed_fetches
+
     def fetch_intraday_data(
         self,
         ticker: str,
@@ -59,40 +172,76 @@ class MarketDataFetcher:
         hours_after: int = 2,
     ) -> Optional[pd.DataFrame]:
         """Fetch intraday data around an event time."""
+        key = None
         try:
-            if event_time.tzinfo is None:
-                event_time = self.tz.localize(event_time)
+            start, end, interval = self._event_window(
+                event_time, hours_before, hours_after
+            )
+            # Too old for intraday bars; a request could only come back empty
+            if interval is None:
+                return None
 
-            start = event_time - timedelta(hours=hours_before)
-            end = event_time + timedelta(hours=hours_after)
+            # Empty results are memoized by the cached fetch; failures are
+            # not, so skip windows that recently raised (e.g. rate limits)
+            key = (ticker, start.isoformat(), end.isoformat(), interval)
+            if self._recently_failed(key):
+                return None
 
-            now = datetime.now(self.tz)
-            days_ago = (now - event_time).days
+            return _fetch_intraday_cached(*key)
 
-            if days_ago <= 7:
-                interval = "1m"
-            elif days_ago <= 60:
-                interval = "5m"
-            else:
-                interval = "1h"
+        except Exception as e:
+            print(f"Error fetching data for {ticker}: {e}")
+            if key is not None:
+                self._failed_fetches[key] = time.monotonic()
+            return None
 
-            stock = yf.Ticker(ticker)
-            df = stock.history(start=start, end=end, interval=interval)
+    def fetch_intraday_batch(
+        self,
+        tickers: List[str],
+        event_time: datetime,
+        hours_before: int = 1,
+        hours_after: int = 2,
+    ) -> Dict[str, Optional[pd.DataFrame]]:
+        """Fetch intraday data for several tickers in one batched download."""
+        if not tickers:
+            return {}
 
-            if df.empty:
-                df = stock.history(period="5d", interval="5m")
+        frames = {}
+        try:
+            start, end, interval = self._event_window(
+                event_time, hours_before, hours_after
+            )
+            if interval is None:
+                return {ticker: None for ticker in tickers}
 
-            if not df.empty:
-                if df.index.tzinfo is None:
-                    df.index = df.index.tz_localize("America/New_York")
-                else:
-                    df.index = df.index.tz_convert("America/New_York")
+            data = _download_intraday_cached(
+                tuple(tickers), start.isoformat(), end.isoformat(), interval
+            )
 
-            return df
+            for ticker in tickers:
+                if ticker in data.columns.get_level_values(0):
+                    df = data[ticker].dropna(subset=["Close"])
+                    if not df.empty:
+                        frames[ticker] = df
 
         except Exception as e:
-            print(f"Error fetching data for {ticker}: {e}")
-            return None
+            print(f"Error downloading batch data: {e}")
+
+        # Tickers the batch could not serve go through the single-ticker
+        # path, which falls back to recent history
+        missing = [ticker for ticker in tickers if ticker not in frames]
+        if missing:
+            workers = min(self.MAX_WORKERS, len(missing))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                fetched = executor.map(
+                    lambda ticker: self.fetch_intraday_data(
+                        ticker, event_time, hours_before, hours_after
+                    ),
+                    missing,
+                )
+                frames.update(zip(missing, fetched))
+
+        return {ticker: frames[ticker] for ticker in tickers}
 
     def calculate_returns(
         self, df: pd.DataFrame, event_time: datetime
@@ -105,31 +254,27 @@ class MarketDataFetcher:
             event_time = self.tz.localize(event_time)
 
         try:
-            mask_before = df.index <= event_time
-            base_idx = mask_before.sum() - 1 if mask_before.any() else 0
-
-            if base_idx < 0 or base_idx >= len(df):
-                return {}
-
-            base_price = df.iloc[base_idx]["Close"]
+            n = len(df)
+            base_idx = max(int(df.index.searchsorted(event_time, side="right")) - 1, 0)
 
-            returns = {}
-            windows = {"1m": 1, "5m": 5, "15m": 15, "30m": 30, "60m": 60, "240m": 240}
+            # Locate every window's first bar at or after its target in one pass
+            targets = event_time + pd.to_timedelta(
+                list(self.RETURN_WINDOWS.values()), unit="m"
+            )
+            target_idx = np.minimum(df.index.searchsorted(targets, side="left"), n - 1)
 
-            for label, minutes in windows.items():
-                target_time = event_time + timedelta(minutes=minutes)
+            if base_idx < n - 1:
+                target_idx = np.where(target_idx <= base_idx, base_idx + 1, target_idx)
 
-                mask_after = df.index >= target_time
-                target_idx = (
-                    int(mask_after.argmax()) if mask_after.any() else len(df) - 1
-                )
-
-                if target_idx <= base_idx and base_idx < len(df) - 1:
-                    target_idx = base_idx + 1
+            close = df["Close"].to_numpy()
+            base_price = close[base_idx]
+            pct = (close[target_idx] - base_price) / base_price * 100
 
-                if 0 <= target_idx < len(df) and target_idx != base_idx:
-                    end_price = df.iloc[target_idx]["Close"]
-                    returns[label] = ((end_price - base_price) / base_price) * 100
+            returns = {
+                label: value
+                for label, value, idx in zip(self.RETURN_WINDOWS, pct, target_idx)
+                if idx != base_idx
+            }
 
             return returns
 
@@ -137,18 +282,32 @@ class MarketDataFetcher:
             print(f"Error calculating returns: {e}")
             return {}
 
-    def get_multi_asset_reaction(self, event_time: datetime) -> pd.DataFrame:
-        """Get reaction of multiple assets to an event."""
-        results = []
-
-        for category, assets in self.ASSETS.items():
-            for ticker, name in assets.items():
-                df = self.fetch_intraday_data(ticker, event_time)
-                if df is not None and not df.empty:
-                    returns = self.calculate_returns(df, event_time)
-                    if returns:
-                        row = {"Ticker": ticker, "Name": name, "Category": category}
-                        row.update(returns)
-                        results.append(row)
-
-        return pd.DataFrame(results)
+    def get_multi_asset_reaction(
+        self,
+        event_time: datetime,
+        frames: Optional[Dict[str, Optional[pd.DataFrame]]] = None,
+    ) -> pd.DataFrame:
+        """Get reaction of multiple assets to an event.
+
+        Pass frames from an earlier fetch_intraday_batch over ASSETS_DF
+        tickers to reuse them instead of downloading again.
+        """
+        if frames is None:
+            frames = self.fetch_intraday_batch(
+                self.ASSETS_DF["Ticker"].tolist(), event_time
+            )
+
+        returns = {}
+        for ticker, df in frames.items():
+            if df is not None and not df.empty:
+                ticker_returns = self.calculate_returns(df, event_time)
+                if ticker_returns:
+                    returns[ticker] = ticker_returns
+
+        if not returns:
+            return pd.DataFrame()
+
+        returns_df = pd.DataFrame.from_dict(returns, orient="index")
+        return self.ASSETS_DF[["Ticker", "Name", "Category"]].merge(
+            returns_df.rename_axis("Ticker").reset_index(), on="Ticker"
+        )